@@ -1,31 +1,83 @@
+import asyncio
 import logging
+import os
 from pathlib import Path
-from typing import AsyncIterator
+from typing import AsyncIterator, Optional
 
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 from fastapi.concurrency import asynccontextmanager
 
+from app.routers import admin as admin_router
 from app.routers import autocomplete as autocomplete_router
 from app.service import TrieService
+from app.tracing import SamplingProfiler, TracingMiddleware, access_logger
 
 BASE_DIR = Path(__file__).parent.parent
 
+# Path to a prebuilt index artifact (see app/index.py), built from the dictionary if unset
+INDEX_PATH_ENV = "AUTOCOMPLETE_INDEX_PATH"
+# When set to "1", start serving immediately and load the index in the background
+FAST_START_ENV = "AUTOCOMPLETE_FAST_START"
+# When set to "1", enable search profiling and the /admin/profile routes.
+# They expose internal code paths and cost CPU, never enable them on a public port
+PROFILING_ENV = "AUTOCOMPLETE_PROFILING"
+# Profile one search out of N when profiling is enabled, unset or 0 disables sampling
+PROFILE_SAMPLE_ENV = "AUTOCOMPLETE_PROFILE_SAMPLE_RATE"
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Access logs are one JSON object per line, kept apart from the plain-text logs
+_access_handler = logging.StreamHandler()
+_access_handler.setFormatter(logging.Formatter("%(message)s"))
+access_logger.addHandler(_access_handler)
+access_logger.propagate = False
+
+def _create_service() -> TrieService:
+    """Build the autocomplete service from the configured index or dictionary
+
+    :return: The loaded TrieService
+    :raises RuntimeError: If dictionary or index file is not found or contains no valid words
+    """
+    index_path: Optional[str] = os.environ.get(INDEX_PATH_ENV)
+    try:
+        return TrieService(BASE_DIR, Path(index_path) if index_path else None)
+    except (FileNotFoundError, ValueError) as e:
+        raise RuntimeError(f"Failed to load dictionary: {e}") from e
+
+
+async def _load_service_in_background(app: FastAPI) -> None:
+    """Load the service off the event loop and publish it once ready
+
+    Failures are logged and leave the service unset, so /health keeps
+    reporting unhealthy and the orchestrator can restart the instance.
+
+    :param app: Application to publish the service on
+    """
+    try:
+        app.state.service = await asyncio.to_thread(_create_service)
+    except Exception:
+        logger.exception("Background service loading failed")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     """Initialize the autocomplete service on application startup
 
+    In fast-start mode the application accepts traffic right away and the
+    service is loaded in the background; /health returns 503 until it is ready.
+
     :raises RuntimeError: If dictionary file is not found or contains no valid words
     """
-    try:
-        service = TrieService(BASE_DIR)
-    except (FileNotFoundError, ValueError) as e:
-        raise RuntimeError(f"Failed to load dictionary: {e}") from e
+    if os.environ.get(FAST_START_ENV) == "1":
+        app.state.service = None
+        loading = asyncio.create_task(_load_service_in_background(app))
+        yield
+        loading.cancel()
+        return
 
-    app.state.service = service
+    app.state.service = _create_service()
     yield
 
 
@@ -35,7 +87,15 @@ app = FastAPI(
     lifespan=lifespan
 )
 
+profiling_enabled = os.environ.get(PROFILING_ENV) == "1"
+profiler = SamplingProfiler(int(os.environ.get(PROFILE_SAMPLE_ENV, "0")) if profiling_enabled else 0)
+app.state.profiler = profiler
+app.add_middleware(TracingMiddleware, profiler=profiler)
+
 app.include_router(autocomplete_router.router)
+app.include_router(admin_router.router)
+if profiling_enabled:
+    app.include_router(admin_router.profile_router)
 
 
 @app.get("/health")
@@ -0,0 +1,65 @@
+import pickle
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+from app.phrase import PhraseIndex
+from app.trie import Trie
+
+INDEX_PATH = "resources/index/trie.pickle"
+
+
+@dataclass
+class Index:
+    """
+    Search structures persisted in a prebuilt index artifact
+
+    :param trie: Trie of the full dictionary entries
+    :param phrases: Inner-token index of the multi-word entries
+    """
+    trie: Trie
+    phrases: PhraseIndex
+
+
+def save_index(index: Index, file_path: Path) -> None:
+    """Serialize built search structures to a prebuilt index artifact
+
+    :param index: The structures to serialize
+    :param file_path: Destination of the artifact, parent directories are created
+    """
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(file_path, "wb") as f:
+        pickle.dump(index, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def load_index(file_path: Path) -> Index:
+    """Load search structures from a prebuilt index artifact
+
+    The artifact is unpickled, so it must come from a trusted build step.
+
+    :param file_path: Path to the artifact
+    :return: The deserialized structures
+    :raises FileNotFoundError: If the artifact does not exist
+    :raises ValueError: If the artifact does not contain an index
+    """
+    if not file_path.exists():
+        raise FileNotFoundError(f"Index artifact not found: {file_path}")
+
+    with open(file_path, "rb") as f:
+        index = pickle.load(f)
+
+    if not isinstance(index, Index):
+        raise ValueError(f"Index artifact does not contain an index: {file_path}")
+
+    return index
+
+
+if __name__ == "__main__":
+    # Build the index artifact from the configured dictionary
+    # Usage: python -m app.index [output_path]
+    from app.service import TrieService
+
+    base_dir = Path(__file__).parent.parent
+    output_path = Path(sys.argv[1]) if len(sys.argv) > 1 else base_dir / INDEX_PATH
+    TrieService(base_dir).save_index(output_path)
+    print(f"Index written to {output_path}")
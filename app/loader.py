@@ -7,7 +7,7 @@ class DictionaryResult:
     """
     Result of loading a dictionary file
 
-    :param words: List of valid words loaded from the file
+    :param words: List of valid words and phrases loaded from the file
     :param skipped_count: Number of malformed lines that were skipped
     """
     words: List[str]
@@ -18,7 +18,8 @@ def load_dictionary(file_path: Path) -> DictionaryResult:
     """Load dictionary from file
 
     Expected file format: Each line contains "XXXXX word" where XXXXX is a
-    numbering scheme (ignored) and word is the actual word.
+    numbering scheme (ignored) and word is the actual word. Multi-word entries
+    ("XXXXX darth vader") are kept whole, with whitespace collapsed.
 
     :param file_path: Path to the dictionary file.
     :return: DictionaryResult containing words and count of skipped lines.
@@ -43,7 +44,7 @@ def load_dictionary(file_path: Path) -> DictionaryResult:
                 skipped_count += 1
                 continue
 
-            word = parts[-1]
+            word = " ".join(parts[1:])
             words.append(word)
 
     if not words:
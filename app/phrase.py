@@ -0,0 +1,141 @@
+import heapq
+import re
+import sys
+from bisect import insort
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from app.trie import Trie, TrieStats
+
+TOKEN_PATTERN = re.compile(r"\S+")
+# Integers in this range are preallocated by the interpreter
+SMALL_INT_MAX = 256
+
+
+@dataclass
+class PhraseStats:
+    """
+    Snapshot of the phrase index statistics
+
+    :param phrase_count: Number of multi-word phrases indexed
+    :param posting_count: Number of (phrase, token) postings
+    :param memory_bytes: Deep memory size of the phrases, postings and token trie
+    :param tokens: Statistics of the token trie
+    """
+    phrase_count: int
+    posting_count: int
+    memory_bytes: int
+    tokens: TrieStats
+
+
+class PhraseIndex:
+    """Token-level inverted prefix index over multi-word phrases
+
+    Matches queries that are a prefix of a phrase starting at an inner token
+    boundary, e.g. "vad" matches "darth vader". Matches at the start of the
+    phrase are left to the phrase trie, so only inner tokens are indexed and
+    single-word dictionaries cost nothing.
+
+    Like :class:`Trie`, statistics are maintained incrementally on insert.
+    """
+
+    def __init__(self) -> None:
+        self._phrases: Set[str] = set()
+        self._tokens = Trie()
+        # Token -> (phrase, character offset of the token in the phrase), sorted by phrase
+        self._postings: Dict[str, List[Tuple[str, int]]] = {}
+        self._posting_count = 0
+        # Excludes the token trie, which measures itself
+        self._memory_bytes = sys.getsizeof(self._phrases) + sys.getsizeof(self._postings)
+
+    def insert(self, phrase: str) -> None:
+        """Index the inner tokens of a phrase
+
+        :param phrase: The phrase to index (will be lowercased)
+        """
+        phrase = phrase.lower()
+        if phrase in self._phrases:
+            return
+
+        offsets = self._inner_token_offsets(phrase)
+        if not offsets:
+            return
+
+        phrases_size = sys.getsizeof(self._phrases)
+        self._phrases.add(phrase)
+        self._memory_bytes += sys.getsizeof(self._phrases) - phrases_size + sys.getsizeof(phrase)
+
+        for token, offset in offsets:
+            self._tokens.insert(token)
+            self._add_posting(token, (phrase, offset))
+
+    def _add_posting(self, token: str, posting: Tuple[str, int]) -> None:
+        """Insert a posting and update the statistics
+
+        :param token: Token the posting belongs to
+        :param posting: (phrase, offset) pair
+        """
+        postings = self._postings.get(token)
+        if postings is None:
+            postings_size = sys.getsizeof(self._postings)
+            postings = self._postings[token] = []
+            self._memory_bytes += sys.getsizeof(self._postings) - postings_size
+            self._memory_bytes += sys.getsizeof(token) + sys.getsizeof(postings)
+
+        list_size = sys.getsizeof(postings)
+        # Kept sorted so searches can merge postings lazily
+        insort(postings, posting)
+        self._memory_bytes += sys.getsizeof(postings) - list_size + sys.getsizeof(posting)
+        if posting[1] > SMALL_INT_MAX:
+            self._memory_bytes += sys.getsizeof(posting[1])
+        self._posting_count += 1
+
+    def stats(self) -> PhraseStats:
+        """Return a snapshot of the phrase index statistics
+
+        :return: PhraseStats including the token trie
+        """
+        tokens = self._tokens.stats()
+        return PhraseStats(
+            phrase_count=len(self._phrases),
+            posting_count=self._posting_count,
+            memory_bytes=self._memory_bytes + tokens.memory_bytes,
+            tokens=tokens,
+        )
+
+    @staticmethod
+    def _inner_token_offsets(phrase: str) -> List[Tuple[str, int]]:
+        """Split a phrase into its tokens after the first one
+
+        :param phrase: Lowercased phrase
+        :return: List of (token, character offset) pairs
+        """
+        tokens = [(match.group(), match.start()) for match in TOKEN_PATTERN.finditer(phrase)]
+        # The first token is matched by the phrase trie
+        return tokens[1:]
+
+    def iter_search(self, query: str) -> Iterator[str]:
+        """Yield phrases matching the query at an inner token boundary
+
+        The sorted postings of the tokens under the query's first token are
+        merged lazily, so the cost follows the number of distinct matching
+        tokens and of results consumed, not the number of candidate phrases.
+
+        :param query: The prefix to search for (will be lowercased)
+        :return: Iterator over matching phrases not starting with the query, in alphabetical order
+        """
+        query = query.lower()
+        if not query or query[0].isspace():
+            return
+        first_token = query.split(maxsplit=1)[0]
+
+        postings = [self._postings[token] for token in self._tokens.iter_search(first_token)]
+        last: Optional[str] = None
+        for phrase, offset in heapq.merge(*postings):
+            # A phrase appears once per matching token, consecutively in the merge
+            if phrase == last:
+                continue
+            # Phrases starting with the query are returned by the phrase trie
+            if phrase.startswith(query, offset) and not phrase.startswith(query):
+                last = phrase
+                yield phrase
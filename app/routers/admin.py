@@ -0,0 +1,66 @@
+from dataclasses import asdict
+from typing import Any, Dict
+
+from fastapi import APIRouter, Query, Request
+
+from app.routers.dependencies import get_service
+
+router = APIRouter(prefix="/admin", tags=["admin"])
+# Only registered when profiling is enabled, see app/api.py
+profile_router = APIRouter(prefix="/admin", tags=["admin"])
+
+@router.get("/stats")
+async def stats(request: Request) -> Dict[str, Any]:
+    """Report trie and phrase index statistics for capacity planning
+
+    :param request: FastAPI request object
+    :return: Total memory size, trie statistics and phrase index statistics
+    :raises HTTPException: 503 if the service is still loading
+    """
+    service = get_service(request)
+    return asdict(service.stats())
+
+
+@profile_router.get("/profile")
+async def profile_report(
+    request: Request,
+    limit: int = Query(30, description="Maximum number of functions in the report", ge=1, le=500),
+) -> Dict[str, Any]:
+    """Report where sampled searches spent their time
+
+    :param request: FastAPI request object
+    :param limit: Maximum number of functions in the report
+    :return: Number of profiled searches and the aggregated report sorted by cumulative time
+    """
+    profiler = request.app.state.profiler
+    return {
+        "profiled_requests": profiler.profiled_requests,
+        "sample_every": profiler.sample_every,
+        "report": profiler.report(limit),
+    }
+
+
+@profile_router.post("/profile")
+async def arm_profiler(
+    request: Request,
+    requests: int = Query(10, description="Number of upcoming searches to profile", ge=1, le=10000),
+) -> Dict[str, Any]:
+    """Profile the next searches on demand, regardless of the sampling rate
+
+    :param request: FastAPI request object
+    :param requests: Number of upcoming searches to profile
+    :return: Number of searches armed for profiling
+    """
+    request.app.state.profiler.arm(requests)
+    return {"armed": requests}
+
+
+@profile_router.delete("/profile")
+async def reset_profiler(request: Request) -> Dict[str, Any]:
+    """Discard the aggregated profile
+
+    :param request: FastAPI request object
+    :return: Confirmation of the reset
+    """
+    request.app.state.profiler.reset()
+    return {"reset": True}
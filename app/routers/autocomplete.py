@@ -1,9 +1,20 @@
+import asyncio
+import json
 import logging
-from typing import List
+from itertools import islice
+from typing import AsyncIterator, Iterator, List, Union
 
 from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+
+from app.routers.dependencies import get_service
+from app.tracing import current_request_id, profiled
+from app.trie import DEFAULT_SEARCH_LIMIT
 
 MAX_QUERY_LENGTH = 50
+MAX_SEARCH_LIMIT = 10000
+# Words serialized per streamed chunk
+STREAM_BATCH_SIZE = 256
 
 logger = logging.getLogger(__name__)
 router = APIRouter(tags=["autocomplete"])
@@ -12,17 +23,23 @@ router = APIRouter(tags=["autocomplete"])
 async def autocomplete(
     request: Request,
     query: str = Query(..., description="Prefix to search for", min_length=1),
-) -> List[str]:
+    limit: int = Query(DEFAULT_SEARCH_LIMIT, description="Maximum number of results", ge=1, le=MAX_SEARCH_LIMIT),
+    stream: bool = Query(False, description="Stream results as NDJSON, one word per line"),
+) -> Union[List[str], StreamingResponse]:
     """Find words in the trie that start with the given prefix
 
     :param request: FastAPI request object
     :param query: Prefix to search for
-    :return: List of matching words, up to the configured limit
+    :param limit: Maximum number of results to return
+    :param stream: Whether to stream results as NDJSON instead of a JSON array
+    :return: List of matching words, or an NDJSON stream of them, up to ``limit``
     :raises HTTPException: 400 if query is empty after stripping or exceeds max length
     :raises HTTPException: 500 if search fails
+    :raises HTTPException: 503 if the service is still loading
     """
-    service = request.app.state.service
-    query = query.strip()
+    service = get_service(request)
+    # Strip and collapse internal whitespace, as dictionary entries are stored
+    query = " ".join(query.split())
 
     if not query:
         raise HTTPException(
@@ -36,12 +53,44 @@ async def autocomplete(
             detail=f"Query too long. Maximum length is {MAX_QUERY_LENGTH} characters"
         )
 
+    if stream:
+        words = islice(service.iter_search(query), limit)
+        return StreamingResponse(_ndjson_lines(words, query), media_type="application/x-ndjson")
+
     try:
-        return service.search(query)
+        with profiled():
+            return service.search(query, limit)
 
     except Exception:
-        logger.exception("Search failed for query: %s", query)
+        logger.exception("Search failed for query: %s (request %s)", query, current_request_id())
         raise HTTPException(
             status_code=500,
             detail="Internal server error during search. Please try again later"
         )
+
+
+async def _ndjson_lines(words: Iterator[str], query: str) -> AsyncIterator[str]:
+    """Serialize words lazily as NDJSON chunks
+
+    Words are sent in batches of ``STREAM_BATCH_SIZE`` lines, yielding to the
+    event loop between batches so long streams do not starve other requests.
+
+    The status code is already sent once streaming starts, so a failing
+    traversal is logged and ends the stream early.
+
+    :param words: Lazy iterator over matching words
+    :param query: Original query, used for logging
+    :return: Async iterator over chunks of NDJSON lines
+    """
+    try:
+        while True:
+            with profiled():
+                batch = list(islice(words, STREAM_BATCH_SIZE))
+            if not batch:
+                break
+
+            yield "".join(json.dumps(word, ensure_ascii=False) + "\n" for word in batch)
+            await asyncio.sleep(0)
+
+    except Exception:
+        logger.exception("Streaming search failed for query: %s (request %s)", query, current_request_id())
@@ -0,0 +1,18 @@
+from fastapi import HTTPException, Request
+
+from app.service import TrieService
+
+def get_service(request: Request) -> TrieService:
+    """Return the autocomplete service, or fail while it is still loading
+
+    :param request: FastAPI request object
+    :return: The loaded TrieService
+    :raises HTTPException: 503 if the service is not ready yet
+    """
+    service = getattr(request.app.state, "service", None)
+    if service is None:
+        raise HTTPException(
+            status_code=503,
+            detail="Service is starting. Please try again later"
+        )
+    return service
@@ -1,32 +1,61 @@
 import time
 import logging
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List
+from itertools import chain, islice
+from typing import Iterator, List, Optional
 
-from app.trie import Trie
-from app.loader import load_dictionary
+from app.phrase import PhraseIndex, PhraseStats
+from app.tracing import stage, timed
+from app.trie import DEFAULT_SEARCH_LIMIT, Trie, TrieStats
 
 DICTIONARY_PATH = "resources/dictionaries/starwars_8k_2018.txt"
 
 logger = logging.getLogger(__name__)
 
+
+@dataclass
+class ServiceStats:
+    """
+    Snapshot of the statistics of every search structure
+
+    :param memory_bytes: Total deep memory size of the trie and phrase index
+    :param trie: Statistics of the dictionary trie
+    :param phrases: Statistics of the phrase index
+    """
+    memory_bytes: int
+    trie: TrieStats
+    phrases: PhraseStats
+
+
 class TrieService:
     """Encapsulates trie-based autocomplete functionality
 
+    Entries starting with the query come first, from the trie, followed by
+    multi-word entries matching the query at an inner token, from the phrase index.
+
     :param base_dir: Base directory for resolving the dictionary file path
-    :raises FileNotFoundError: If the dictionary file does not exist
-    :raises ValueError: If the dictionary file contains no valid words
+    :param index_path: Optional prebuilt index artifact, loaded instead of building from the dictionary
+    :raises FileNotFoundError: If the dictionary file or index artifact does not exist
+    :raises ValueError: If the dictionary file contains no valid words or the artifact is not a trie
     """
 
-    def __init__(self, base_dir: Path) -> None:
-        self._trie = Trie()
-        self._load_dictionary(base_dir)
+    def __init__(self, base_dir: Path, index_path: Optional[Path] = None) -> None:
+        if index_path is not None:
+            self._load_index(index_path)
+        else:
+            self._trie = Trie()
+            self._phrases = PhraseIndex()
+            self._load_dictionary(base_dir)
 
     def _load_dictionary(self, base_dir: Path) -> None:
         """Load dictionary file and populate the trie
 
         :param base_dir: Base directory for resolving the dictionary file path
         """
+        # Only needed when building from source, not on the artifact path
+        from app.loader import load_dictionary
+
         start_time = time.time()
 
         dictionary_path = base_dir / DICTIONARY_PATH
@@ -34,14 +63,72 @@ class TrieService:
 
         for word in result.words:
             self._trie.insert(word)
+            self._phrases.insert(word)
 
         load_time = time.time() - start_time
         logger.info(f"Trie built with {len(result.words)} words in {load_time:.2f}s (skipped {result.skipped_count} malformed lines)")
 
-    def search(self, query: str) -> List[str]:
+    def _load_index(self, index_path: Path) -> None:
+        """Load the trie and phrase index from a prebuilt index artifact
+
+        :param index_path: Path to the artifact
+        """
+        from app.index import load_index
+
+        start_time = time.time()
+        index = load_index(index_path)
+        self._trie = index.trie
+        self._phrases = index.phrases
+
+        load_time = time.time() - start_time
+        logger.info(f"Trie loaded with {self._trie.stats().word_count} words from {index_path} in {load_time:.2f}s")
+
+    def save_index(self, index_path: Path) -> None:
+        """Write the loaded trie and phrase index to a prebuilt index artifact
+
+        :param index_path: Destination of the artifact
+        """
+        from app.index import Index, save_index
+
+        save_index(Index(trie=self._trie, phrases=self._phrases), index_path)
+
+    def search(self, query: str, limit: int = DEFAULT_SEARCH_LIMIT) -> List[str]:
         """Search for words matching the given prefix
 
         :param query: The prefix to search for (will be lowercased)
-        :return: List of matching words in alphabetical order
+        :param limit: Maximum number of results to return
+        :return: List of matching words, each group in alphabetical order
+        """
+        with stage("trie"):
+            results = self._trie.search(query, limit)
+
+        if len(results) < limit:
+            with stage("phrases"):
+                results.extend(islice(self._phrases.iter_search(query), limit - len(results)))
+
+        return results
+
+    def iter_search(self, query: str) -> Iterator[str]:
+        """Lazily yield words matching the given prefix
+
+        :param query: The prefix to search for (will be lowercased)
+        :return: Iterator over matching words, each group in alphabetical order
+        """
+        # The phrase index is only queried once the trie matches are exhausted
+        return chain(
+            timed("trie", self._trie.iter_search(query)),
+            timed("phrases", self._phrases.iter_search(query)),
+        )
+
+    def stats(self) -> ServiceStats:
+        """Return statistics about the loaded trie and phrase index
+
+        :return: ServiceStats snapshot of the search structures
         """
-        return self._trie.search(query)
+        trie = self._trie.stats()
+        phrases = self._phrases.stats()
+        return ServiceStats(
+            memory_bytes=trie.memory_bytes + phrases.memory_bytes,
+            trie=trie,
+            phrases=phrases,
+        )
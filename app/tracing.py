@@ -0,0 +1,271 @@
+import cProfile
+import io
+import json
+import logging
+import pstats
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Dict, Iterator, Optional, TypeVar
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+REQUEST_ID_HEADER = "X-Request-ID"
+MAX_REQUEST_ID_LENGTH = 128
+
+access_logger = logging.getLogger("app.access")
+
+T = TypeVar("T")
+
+
+class SamplingProfiler:
+    """Profiles the search of sampled requests and aggregates the results
+
+    Searches are sampled 1-in-``sample_every``, or explicitly after :meth:`arm`.
+    When disabled, the sampling decision checks the armed counter and the rate
+    once per request. The surrounding :func:`profiled` and :func:`stage` context
+    managers still run on every search, see the README for measured costs.
+
+    :param sample_every: Profile one request out of this many, 0 disables sampling
+    """
+
+    def __init__(self, sample_every: int = 0) -> None:
+        self.sample_every = sample_every
+        self.profiled_requests = 0
+        self._seen = 0
+        self._armed = 0
+        self._stats: Optional[pstats.Stats] = None
+
+    def should_sample(self) -> bool:
+        """Decide whether the current search is profiled
+
+        :return: True if the search should be profiled
+        """
+        if self._armed:
+            self._armed -= 1
+            self.profiled_requests += 1
+            return True
+
+        if not self.sample_every:
+            return False
+
+        self._seen += 1
+        if self._seen % self.sample_every:
+            return False
+
+        self.profiled_requests += 1
+        return True
+
+    def arm(self, requests: int) -> None:
+        """Profile the next searches regardless of the sampling rate
+
+        :param requests: Number of upcoming searches to profile
+        """
+        self._armed = requests
+
+    @contextmanager
+    def profile(self) -> Iterator[None]:
+        """Profile the enclosed block and merge it into the aggregate
+
+        A streamed search is profiled once per batch, all merged into the same aggregate.
+        """
+        profile = cProfile.Profile()
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            if self._stats is None:
+                self._stats = pstats.Stats(profile)
+            else:
+                self._stats.add(profile)
+
+    def report(self, limit: int) -> str:
+        """Render the aggregated profile, sorted by cumulative time
+
+        :param limit: Maximum number of functions to include
+        :return: pstats text report, empty if nothing was profiled
+        """
+        if self._stats is None:
+            return ""
+
+        output = io.StringIO()
+        self._stats.stream = output
+        self._stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(limit)
+        return output.getvalue()
+
+    def reset(self) -> None:
+        """Discard the aggregated profile and pending armed requests"""
+        self.profiled_requests = 0
+        self._armed = 0
+        self._stats = None
+
+
+@dataclass
+class RequestTrace:
+    """
+    Tracing state of a single request
+
+    :param request_id: Identifier propagated in logs and the response header
+    :param profiler: Profiler deciding whether the request's search is profiled
+    :param stages: Cumulated duration of each named stage, in seconds
+    :param profiled: Whether the request was sampled by the profiler, None until its search starts
+    """
+    request_id: str
+    profiler: SamplingProfiler
+    stages: Dict[str, float] = field(default_factory=dict)
+    profiled: Optional[bool] = None
+
+
+_current_trace: ContextVar[Optional[RequestTrace]] = ContextVar("current_trace", default=None)
+
+
+def current_request_id() -> Optional[str]:
+    """Return the identifier of the request being handled
+
+    :return: Request ID, or None outside of a traced request
+    """
+    trace = _current_trace.get()
+    return trace.request_id if trace is not None else None
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """Time the enclosed block as a named stage of the current request
+
+    Does nothing outside of a traced request.
+
+    :param name: Stage name reported in the access log
+    """
+    trace = _current_trace.get()
+    if trace is None:
+        yield
+        return
+
+    start = perf_counter()
+    try:
+        yield
+    finally:
+        trace.stages[name] = trace.stages.get(name, 0.0) + perf_counter() - start
+
+
+def timed(name: str, iterator: Iterator[T]) -> Iterator[T]:
+    """Time each step of a lazy iterator as a named stage of the current request
+
+    Time spent by the consumer between steps is not counted. Returns the
+    iterator unchanged outside of a traced request.
+
+    :param name: Stage name reported in the access log
+    :param iterator: Lazy iterator to time
+    :return: Iterator yielding the same items
+    """
+    trace = _current_trace.get()
+    if trace is None:
+        return iterator
+    return _timed_steps(trace, name, iterator)
+
+
+def _timed_steps(trace: RequestTrace, name: str, iterator: Iterator[T]) -> Iterator[T]:
+    """Generator behind :func:`timed`, bound to the trace it was created in
+
+    :param trace: Trace receiving the stage duration
+    :param name: Stage name reported in the access log
+    :param iterator: Lazy iterator to time
+    :return: Iterator yielding the same items
+    """
+    while True:
+        start = perf_counter()
+        try:
+            item = next(iterator)
+        except StopIteration:
+            return
+        finally:
+            trace.stages[name] = trace.stages.get(name, 0.0) + perf_counter() - start
+        yield item
+
+
+@contextmanager
+def profiled() -> Iterator[None]:
+    """Profile the enclosed block if the profiler samples the current request
+
+    Sampling is decided here rather than in the middleware, so health checks
+    and admin calls do not consume samples.
+    """
+    trace = _current_trace.get()
+    if trace is None:
+        yield
+        return
+
+    # Decided once per request, a streamed search enters this block once per batch
+    if trace.profiled is None:
+        trace.profiled = trace.profiler.should_sample()
+
+    if not trace.profiled:
+        yield
+        return
+
+    with trace.profiler.profile():
+        yield
+
+
+def _incoming_request_id(scope: Scope) -> Optional[str]:
+    """Read a client-provided request ID, ignoring unsafe values
+
+    :param scope: ASGI connection scope
+    :return: The request ID if present and valid, None otherwise
+    """
+    value = Headers(scope=scope).get(REQUEST_ID_HEADER)
+    if value and len(value) <= MAX_REQUEST_ID_LENGTH and value.isascii() and value.isprintable():
+        return value
+    return None
+
+
+class TracingMiddleware:
+    """ASGI middleware assigning request IDs and emitting JSON access logs
+
+    The access log is written once the response body is fully sent, so
+    streamed responses are timed until their last chunk.
+
+    :param app: The wrapped ASGI application
+    :param profiler: Profiler made available to the request's search
+    """
+
+    def __init__(self, app: ASGIApp, profiler: SamplingProfiler) -> None:
+        self.app = app
+        self.profiler = profiler
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = _incoming_request_id(scope) or uuid.uuid4().hex
+        trace = RequestTrace(request_id=request_id, profiler=self.profiler)
+        status_code = 500
+
+        async def send_with_request_id(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                MutableHeaders(scope=message).append(REQUEST_ID_HEADER, request_id)
+            await send(message)
+
+        token = _current_trace.set(trace)
+        start = perf_counter()
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            duration = perf_counter() - start
+            _current_trace.reset(token)
+            access_logger.info(json.dumps({
+                "request_id": request_id,
+                "method": scope["method"],
+                "path": scope["path"],
+                "status": status_code,
+                "duration_ms": round(duration * 1000, 3),
+                "stages_ms": {name: round(seconds * 1000, 3) for name, seconds in trace.stages.items()},
+                "profiled": bool(trace.profiled),
+            }))
@@ -1,4 +1,7 @@
-from typing import Dict, List
+import sys
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Tuple
 
 DEFAULT_SEARCH_LIMIT = 4
 
@@ -9,16 +12,55 @@ class TrieNode:
     :ivar is_end_of_word: Whether this node marks the end of a valid word
     """
 
+    # No per-node attribute dict, which also keeps the node size measurable
+    __slots__ = ("children", "is_end_of_word")
+
     def __init__(self) -> None:
         self.children: Dict[str, 'TrieNode'] = {}
         self.is_end_of_word: bool = False
 
 
+@dataclass
+class TrieStats:
+    """
+    Snapshot of the trie structure statistics
+
+    :param node_count: Number of nodes in the trie, root included
+    :param word_count: Number of distinct words stored in the trie
+    :param memory_bytes: Deep memory size of the nodes and their children mappings
+    :param branching_factors: Mapping of children count to number of nodes having that many children
+    :param depth_histogram: Mapping of depth to number of nodes at that depth (root is depth 0)
+    """
+    node_count: int
+    word_count: int
+    memory_bytes: int
+    branching_factors: Dict[int, int]
+    depth_histogram: Dict[int, int]
+
+
+def _node_size(node: TrieNode) -> int:
+    """Shallow memory size of a node and its children mapping
+
+    :param node: Node to measure
+    :return: Size in bytes
+    """
+    return sys.getsizeof(node) + sys.getsizeof(node.children)
+
+
 class Trie:
-    """A trie (prefix tree) data structure for efficient prefix-based word lookup"""
+    """A trie (prefix tree) data structure for efficient prefix-based word lookup
+
+    Structure statistics are maintained incrementally on insert, so :meth:`stats`
+    never walks the trie.
+    """
 
     def __init__(self) -> None:
         self.root = TrieNode()
+        self._node_count = 1
+        self._word_count = 0
+        self._memory_bytes = _node_size(self.root)
+        self._branching_factors: Dict[int, int] = {0: 1}
+        self._depth_histogram: Dict[int, int] = {0: 1}
 
     def insert(self, word: str) -> None:
         """Insert a word into the trie
@@ -28,12 +70,98 @@ class Trie:
         node = self.root
         word = word.lower()
     
-        for char in word:
+        for depth, char in enumerate(word, start=1):
             if char not in node.children:
-                node.children[char] = TrieNode()
+                self._add_child(node, char, depth)
             node = node.children[char]
 
-        node.is_end_of_word = True
+        if not node.is_end_of_word:
+            node.is_end_of_word = True
+            self._word_count += 1
+
+    def _add_child(self, parent: TrieNode, char: str, depth: int) -> None:
+        """Create a child node and update the structure statistics
+
+        :param parent: Node receiving the new child
+        :param char: Character labelling the edge to the new child
+        :param depth: Depth of the new child
+        """
+        fanout = len(parent.children)
+        children_size = sys.getsizeof(parent.children)
+
+        child = TrieNode()
+        parent.children[char] = child
+
+        # The children dict may have been resized by the insertion
+        self._memory_bytes += sys.getsizeof(parent.children) - children_size
+        # Single-character keys are shared interpreter-cached strings for Latin-1,
+        # which covers the dictionaries, so they are not counted per edge
+        self._memory_bytes += _node_size(child)
+        self._node_count += 1
+
+        self._branching_factors[fanout] -= 1
+        if not self._branching_factors[fanout]:
+            del self._branching_factors[fanout]
+        self._branching_factors[fanout + 1] = self._branching_factors.get(fanout + 1, 0) + 1
+        self._branching_factors[0] = self._branching_factors.get(0, 0) + 1
+
+        self._depth_histogram[depth] = self._depth_histogram.get(depth, 0) + 1
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Flatten the node tree for pickling
+
+        Nodes are listed breadth-first as parallel edge arrays, so pickling
+        does not recurse once per character of the longest word.
+
+        :return: Picklable state of the trie
+        """
+        state = self.__dict__.copy()
+        nodes = [state.pop("root")]
+        parents: List[int] = []
+        chars: List[str] = []
+        ends = bytearray([nodes[0].is_end_of_word])
+
+        # nodes grows while it is iterated, visiting the tree breadth-first
+        for index, node in enumerate(nodes):
+            for char, child in node.children.items():
+                parents.append(index)
+                chars.append(char)
+                ends.append(child.is_end_of_word)
+                nodes.append(child)
+
+        state["_edges"] = (parents, "".join(chars), bytes(ends))
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Rebuild the node tree from its flattened edges
+
+        :param state: State produced by :meth:`__getstate__`
+        """
+        parents, chars, ends = state.pop("_edges")
+        nodes = [TrieNode()]
+        nodes[0].is_end_of_word = bool(ends[0])
+
+        for index, (parent, char) in enumerate(zip(parents, chars), start=1):
+            child = TrieNode()
+            child.is_end_of_word = bool(ends[index])
+            nodes[parent].children[char] = child
+            nodes.append(child)
+
+        self.__dict__.update(state)
+        self.root = nodes[0]
+
+    def stats(self) -> TrieStats:
+        """Return a snapshot of the trie structure statistics
+
+        :return: TrieStats with node, word and memory counters
+        """
+        return TrieStats(
+            node_count=self._node_count,
+            word_count=self._word_count,
+            memory_bytes=self._memory_bytes,
+            branching_factors=dict(sorted(self._branching_factors.items())),
+            depth_histogram=dict(sorted(self._depth_histogram.items())),
+        )
 
 
     def search(self, prefix: str, limit: int = DEFAULT_SEARCH_LIMIT) -> List[str]:
@@ -43,56 +171,39 @@ class Trie:
         :param limit: Maximum number of results to return
         :return: List of matching words in alphabetical order, up to ``limit`` results
         """
-        if not prefix:
-            return []
-        
-        prefix = prefix.lower()
-        
-        # Navigate to the prefix node
-        node = self.root
-        for char in prefix: 
-            if char not in node.children:
-                return []
-            node = node.children[char]
-
-        results: List[str] = []
-        self._dfs_collect(node, prefix, results, limit)
+        return list(islice(self.iter_search(prefix), limit))
 
-        return results
+    def iter_search(self, prefix: str) -> Iterator[str]:
+        """Lazily yield words in the trie that start with the given prefix
 
-    def _dfs_collect(
-            self,
-            node: TrieNode,
-            current_word: str,
-            results: List[str],
-            limit: int
-        ) -> None:
-        """Collect words via depth-first traversal from the given node
+        Words are produced one at a time by a depth-first traversal, so the
+        caller only pays for the results it consumes.
 
-        :param node: Current trie node to traverse from
-        :param current_word: The word prefix built so far
-        :param results: Output list to append matching words to
-        :param limit: Maximum number of results to collect
+        :param prefix: The prefix to search for (will be lowercased)
+        :return: Iterator over matching words in alphabetical order
         """
-
-        if len(results) >= limit:
+        if not prefix:
             return
-        
-        if node.is_end_of_word:
-            results.append(current_word)
 
-        # Sorting here may cause performance hit for large tries
-        # See discussion in README.md
-        for char in sorted(node.children.keys()):
+        prefix = prefix.lower()
+
+        # Navigate to the prefix node
+        node = self.root
+        for char in prefix:
+            if char not in node.children:
+                return
+            node = node.children[char]
 
-            # Avoid unnecessary traversal if limit is reached
-            if len(results) >= limit:
-                break
+        # Explicit stack instead of recursion so the traversal can be suspended
+        stack: List[Tuple[TrieNode, str]] = [(node, prefix)]
+        while stack:
+            node, current_word = stack.pop()
 
-            self._dfs_collect(
-                node.children[char],
-                current_word + char, # This will create a new string object for every call. Could be optimized with a list and join if needed
-                results,
-                limit
-            )
+            if node.is_end_of_word:
+                yield current_word
 
+            # Sorting here may cause performance hit for large tries
+            # See discussion in README.md
+            # Pushed in reverse so the smallest character is popped first
+            for char in sorted(node.children.keys(), reverse=True):
+                stack.append((node.children[char], current_word + char))
@@ -0,0 +1,269 @@
+"""Replay autocomplete traffic against the API and report latency statistics
+
+The workload is either a recorded query log (one query per line) or a
+synthetic keystroke workload: words are drawn from a dictionary following a
+Zipf distribution and every prefix of each word is sent, as a user typing it
+would.
+
+Requests are sent open-loop at a fixed target rate, so latency is measured
+from the time each request was scheduled rather than sent. A saturated server
+then shows up as growing latency instead of a silently lower request rate.
+
+Usage:
+    python benchmarks/loadtest.py --rate 500 --requests 5000
+    python benchmarks/loadtest.py --log queries.txt --url http://127.0.0.1:8000
+"""
+import argparse
+import asyncio
+import logging
+import math
+import random
+import sys
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from itertools import accumulate
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import httpx
+
+BASE_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(BASE_DIR))
+
+from app.loader import load_dictionary  # noqa: E402
+
+DEFAULT_DICTIONARY = BASE_DIR / "resources/dictionaries/starwars_8k_2018.txt"
+DEFAULT_ZIPF_EXPONENT = 1.1
+
+
+@dataclass
+class LoadTestReport:
+    """
+    Outcome of a load test run
+
+    :param latencies: Latency of every completed request, in seconds
+    :param status_codes: Number of responses per HTTP status code
+    :param transport_errors: Number of requests that failed without a response
+    :param elapsed: Wall-clock duration of the run, in seconds
+    """
+    latencies: List[float] = field(default_factory=list)
+    status_codes: Counter = field(default_factory=Counter)
+    transport_errors: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def total(self) -> int:
+        """Number of requests sent, answered or not"""
+        return sum(self.status_codes.values()) + self.transport_errors
+
+    @property
+    def client_errors(self) -> int:
+        """Number of 4xx responses"""
+        return sum(count for code, count in self.status_codes.items() if 400 <= code < 500)
+
+    @property
+    def server_errors(self) -> int:
+        """Number of 5xx responses, including 503 while a fast-start instance is loading"""
+        return sum(count for code, count in self.status_codes.items() if code >= 500)
+
+    @property
+    def errors(self) -> int:
+        """Number of failed requests: 4xx, 5xx and transport errors"""
+        return self.client_errors + self.server_errors + self.transport_errors
+
+    def percentile(self, pct: float) -> float:
+        """Latency percentile using the nearest-rank method
+
+        :param pct: Percentile between 0 and 100
+        :return: Latency in seconds, 0 if no request completed
+        """
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        rank = max(0, min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1))
+        return ordered[rank]
+
+    def summary(self) -> Dict[str, float]:
+        """Flatten the report into printable metrics
+
+        :return: Mapping of metric name to value
+        """
+        return {
+            "requests": self.total,
+            "elapsed_s": self.elapsed,
+            "throughput_rps": self.total / self.elapsed if self.elapsed else 0.0,
+            "error_rate": self.errors / self.total if self.total else 0.0,
+            "client_errors": self.client_errors,
+            "server_errors": self.server_errors,
+            "transport_errors": self.transport_errors,
+            "p50_ms": self.percentile(50) * 1000,
+            "p90_ms": self.percentile(90) * 1000,
+            "p99_ms": self.percentile(99) * 1000,
+            "max_ms": max(self.latencies, default=0.0) * 1000,
+        }
+
+
+def load_query_log(file_path: Path) -> List[str]:
+    """Load recorded queries, one per line
+
+    :param file_path: Path to the query log
+    :return: List of non-empty queries in recorded order
+    :raises ValueError: If the log contains no queries
+    """
+    with open(file_path, "r", encoding="utf-8") as f:
+        queries = [line.rstrip("\n") for line in f if line.strip()]
+
+    if not queries:
+        raise ValueError(f"No queries found in {file_path}")
+    return queries
+
+
+def synthesize_keystrokes(
+        words: List[str],
+        count: int,
+        exponent: float = DEFAULT_ZIPF_EXPONENT,
+        seed: Optional[int] = None
+    ) -> List[str]:
+    """Build a keystroke workload from Zipf-distributed dictionary words
+
+    Word popularity follows ``1 / rank ** exponent`` over a shuffled dictionary,
+    and each drawn word contributes all its prefixes in typing order.
+
+    :param words: Dictionary words to draw from
+    :param count: Number of queries to generate
+    :param exponent: Zipf exponent, higher values concentrate traffic on fewer words
+    :param seed: Random seed for a reproducible workload
+    :return: List of ``count`` prefix queries
+    """
+    rng = random.Random(seed)
+    ranked = list(words)
+    rng.shuffle(ranked)
+    # Cumulated once, so each draw is a bisection instead of a pass over the dictionary
+    cum_weights = list(accumulate(1 / rank ** exponent for rank in range(1, len(ranked) + 1)))
+
+    queries: List[str] = []
+    while len(queries) < count:
+        word = rng.choices(ranked, cum_weights=cum_weights)[0]
+        queries.extend(word[:length] for length in range(1, len(word) + 1))
+
+    return queries[:count]
+
+
+async def _send(
+        client: httpx.AsyncClient,
+        query: str,
+        scheduled: float,
+        semaphore: asyncio.Semaphore,
+        report: LoadTestReport
+    ) -> None:
+    """Send one request and record its outcome
+
+    :param client: HTTP client bound to the target
+    :param query: Autocomplete prefix to request
+    :param scheduled: perf_counter time at which the request was due
+    :param semaphore: Bounds the number of in-flight requests
+    :param report: Report to record the outcome into
+    """
+    async with semaphore:
+        try:
+            response = await client.get("/autocomplete", params={"query": query})
+        except httpx.HTTPError:
+            report.transport_errors += 1
+            return
+
+    report.latencies.append(time.perf_counter() - scheduled)
+    report.status_codes[response.status_code] += 1
+
+
+async def run(client: httpx.AsyncClient, queries: List[str], rate: float, concurrency: int) -> LoadTestReport:
+    """Replay queries open-loop at the target rate
+
+    :param client: HTTP client bound to the target
+    :param queries: Queries to send, in order
+    :param rate: Target requests per second
+    :param concurrency: Maximum number of in-flight requests
+    :return: LoadTestReport for the run
+    """
+    report = LoadTestReport()
+    semaphore = asyncio.Semaphore(concurrency)
+    tasks = []
+
+    start = time.perf_counter()
+    for i, query in enumerate(queries):
+        scheduled = start + i / rate
+        delay = scheduled - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        tasks.append(asyncio.create_task(_send(client, query, scheduled, semaphore, report)))
+
+    await asyncio.gather(*tasks)
+    report.elapsed = time.perf_counter() - start
+    return report
+
+
+async def run_in_process(queries: List[str], rate: float, concurrency: int) -> LoadTestReport:
+    """Replay queries against ``app.api:app`` without a network server
+
+    :param queries: Queries to send, in order
+    :param rate: Target requests per second
+    :param concurrency: Maximum number of in-flight requests
+    :return: LoadTestReport for the run
+    """
+    from app.api import app
+
+    # ASGITransport does not run the lifespan, the service is built here
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://loadtest") as client:
+            return await run(client, queries, rate, concurrency)
+
+
+async def run_remote(url: str, queries: List[str], rate: float, concurrency: int) -> LoadTestReport:
+    """Replay queries against a running server
+
+    :param url: Base URL of the server, e.g. http://127.0.0.1:8000
+    :param queries: Queries to send, in order
+    :param rate: Target requests per second
+    :param concurrency: Maximum number of in-flight requests
+    :return: LoadTestReport for the run
+    """
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(base_url=url, limits=limits) as client:
+        return await run(client, queries, rate, concurrency)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", help="Target a running server instead of the in-process ASGI app")
+    parser.add_argument("--log", type=Path, help="Query log to replay, one query per line")
+    parser.add_argument("--dictionary", type=Path, default=DEFAULT_DICTIONARY, help="Dictionary for the synthetic workload")
+    parser.add_argument("--requests", type=int, default=2000, help="Number of synthetic queries to send")
+    parser.add_argument("--zipf", type=float, default=DEFAULT_ZIPF_EXPONENT, help="Zipf exponent of the synthetic workload")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed of the synthetic workload")
+    parser.add_argument("--rate", type=float, default=200.0, help="Target requests per second")
+    parser.add_argument("--concurrency", type=int, default=64, help="Maximum in-flight requests")
+    args = parser.parse_args()
+
+    # Per-request access logs would dominate the run time
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    logging.getLogger("app.access").setLevel(logging.WARNING)
+
+    if args.log:
+        queries = load_query_log(args.log)
+    else:
+        words = load_dictionary(args.dictionary).words
+        queries = synthesize_keystrokes(words, args.requests, args.zipf, args.seed)
+
+    if args.url:
+        report = asyncio.run(run_remote(args.url, queries, args.rate, args.concurrency))
+    else:
+        report = asyncio.run(run_in_process(queries, args.rate, args.concurrency))
+
+    for name, value in report.summary().items():
+        print(f"{name:>16}: {value:.2f}" if isinstance(value, float) else f"{name:>16}: {value}")
+    print(f"{'status_codes':>16}: {dict(report.status_codes)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""Measure cold-start time of the API, phase by phase
+
+Each run happens in a fresh interpreter so module caches do not hide the
+import cost. Reported phases:
+    import      importing app.api (FastAPI, routers, service modules)
+    build       building the trie from the dictionary
+    artifact    loading the trie from a prebuilt index artifact
+    first_req   serving the first /autocomplete request after startup
+    fast_ready  fast start with the artifact: from the start of startup
+                (lifespan entry) until /health returns 200
+    fast_200    fast start with the artifact: from lifespan entry until
+                the first /autocomplete request returns 200
+
+Usage:
+    python benchmarks/startup.py --runs 5
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, List
+
+BASE_DIR = Path(__file__).parent.parent
+
+# Executed in a child interpreter, prints the phase timings as JSON
+PROBE = """
+import json, logging, sys, time
+from pathlib import Path
+
+start = time.perf_counter()
+import app.api
+imported = time.perf_counter()
+
+logging.disable(logging.CRITICAL)
+from app.service import TrieService
+base_dir = Path(sys.argv[1])
+TrieService(base_dir)
+built = time.perf_counter()
+TrieService(base_dir, Path(sys.argv[2]))
+loaded = time.perf_counter()
+
+from fastapi.testclient import TestClient
+with TestClient(app.api.app) as client:
+    ready = time.perf_counter()
+    client.get("/autocomplete", params={"query": "fac"})
+    answered = time.perf_counter()
+
+print(json.dumps({
+    "import": imported - start,
+    "build": built - imported,
+    "artifact": loaded - built,
+    "first_req": answered - ready,
+}))
+"""
+
+# Executed in a child interpreter with fast start and the artifact configured,
+# prints the time from lifespan entry until the given URL first returns 200
+FAST_START_PROBE = """
+import json, logging, sys, time
+
+import app.api
+from fastapi.testclient import TestClient
+
+logging.disable(logging.CRITICAL)
+
+start = time.perf_counter()
+with TestClient(app.api.app) as client:
+    while client.get(sys.argv[2]).status_code != 200:
+        time.sleep(0.001)
+    elapsed = time.perf_counter() - start
+
+print(json.dumps({sys.argv[1]: elapsed}))
+"""
+
+
+def _run_probe(probe: str, args: List[str], env: Dict[str, str]) -> Dict[str, float]:
+    """Run a probe in a fresh interpreter and parse its timings
+
+    :param probe: Python source printing its timings as JSON on the last line
+    :param args: Command line arguments for the probe
+    :param env: Environment variables added to the current environment
+    :return: Mapping of phase name to its timing in seconds
+    """
+    output = subprocess.run(
+        [sys.executable, "-c", probe, *args],
+        cwd=BASE_DIR, check=True, capture_output=True, text=True,
+        env={**os.environ, **env}
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def measure(runs: int) -> Dict[str, List[float]]:
+    """Run the startup probe in fresh interpreters
+
+    :param runs: Number of cold starts to measure
+    :return: Mapping of phase name to its timings in seconds
+    """
+    sys.path.insert(0, str(BASE_DIR))
+    from app.service import TrieService
+
+    timings: Dict[str, List[float]] = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        index_path = Path(tmp_dir) / "trie.pickle"
+        TrieService(BASE_DIR).save_index(index_path)
+
+        blocking_env = {
+            "AUTOCOMPLETE_FAST_START": "0",
+            "AUTOCOMPLETE_INDEX_PATH": "",
+        }
+        fast_start_env = {
+            "AUTOCOMPLETE_FAST_START": "1",
+            "AUTOCOMPLETE_INDEX_PATH": str(index_path),
+        }
+
+        for _ in range(runs):
+            # Both fast-start phases are measured from their own cold interpreter
+            phases = _run_probe(PROBE, [str(BASE_DIR), str(index_path)], blocking_env)
+            phases.update(_run_probe(FAST_START_PROBE, ["fast_ready", "/health"], fast_start_env))
+            phases.update(_run_probe(FAST_START_PROBE, ["fast_200", "/autocomplete?query=fac"], fast_start_env))
+            for phase, seconds in phases.items():
+                timings.setdefault(phase, []).append(seconds)
+
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="Number of cold starts to measure")
+    args = parser.parse_args()
+
+    for phase, seconds in measure(args.runs).items():
+        print(f"{phase:>10}: median {statistics.median(seconds) * 1000:8.1f} ms, max {max(seconds) * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,38 @@
+import asyncio
+import json
+import logging
+import time
 from unittest.mock import patch
 
 import pytest
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
-from app.api import app
+from app.api import BASE_DIR, FAST_START_ENV, INDEX_PATH_ENV, app
+from app.service import TrieService
+from app.routers import admin as admin_router
+from app.routers import autocomplete as autocomplete_router
+from app.tracing import SamplingProfiler, TracingMiddleware, access_logger
 
 @pytest.fixture(scope="module")
 def client():
      with TestClient(app) as test_client:
         yield test_client
 
+@pytest.fixture(scope="module")
+def profiling_client():
+    """Client for an app wired like app.api with profiling enabled"""
+    profiling_app = FastAPI()
+    profiler = SamplingProfiler()
+    profiling_app.state.profiler = profiler
+    profiling_app.state.service = TrieService(BASE_DIR)
+    profiling_app.add_middleware(TracingMiddleware, profiler=profiler)
+    profiling_app.include_router(autocomplete_router.router)
+    profiling_app.include_router(admin_router.profile_router)
+
+    with TestClient(profiling_app) as test_client:
+        yield test_client
+
 class TestAutocompleteAPI:
     def test_basic_autocomplete(self, client):
         """Test basic autocomplete"""
@@ -35,6 +58,15 @@ class TestAutocompleteAPI:
         assert len(data) == 4
         assert "apparently" in data
 
+    def test_query_internal_whitespace_collapsed(self, client):
+        """Test that internal whitespace runs are collapsed like dictionary entries"""
+
+        with patch.object(app.state.service, "search", return_value=[]) as search:
+            response = client.get("/autocomplete", params={"query": " darth  \t vader "})
+
+        assert response.status_code == 200
+        search.assert_called_once_with("darth vader", 4)
+
     def test_query_whitespace_only_returns_400(self, client):
         """Test that whitespace-only query returns 400 after stripping"""
 
@@ -60,6 +92,149 @@ class TestAutocompleteAPI:
 
         assert response.status_code == 200
 
+    def test_limit_parameter(self, client):
+        """Test that limit raises the number of returned words"""
+
+        response = client.get("/autocomplete?query=a&limit=20")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data) == 20
+        assert data == sorted(data)
+
+    def test_limit_above_max_returns_422(self, client):
+        """Test that limit above the maximum is rejected"""
+
+        response = client.get("/autocomplete?query=a&limit=10001")
+
+        assert response.status_code == 422
+
+    def test_stream_returns_ndjson(self, client):
+        """Test that stream mode returns one JSON word per line"""
+
+        response = client.get("/autocomplete?query=a&limit=50&stream=true")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        words = [json.loads(line) for line in response.text.splitlines()]
+        assert words == client.get("/autocomplete?query=a&limit=50").json()
+
+    def test_stream_sends_words_in_batches(self, monkeypatch):
+        """Test that streamed words are grouped into chunks of whole lines"""
+
+        monkeypatch.setattr(autocomplete_router, "STREAM_BATCH_SIZE", 50)
+        words = iter(f"word{i}" for i in range(120))
+
+        async def collect():
+            return [chunk async for chunk in autocomplete_router._ndjson_lines(words, "word")]
+
+        chunks = asyncio.run(collect())
+
+        assert [len(chunk.splitlines()) for chunk in chunks] == [50, 50, 20]
+        assert chunks[0].splitlines()[0] == '"word0"'
+
+    def test_stream_no_match_is_empty(self, client):
+        """Test that stream mode returns an empty body when nothing matches"""
+
+        response = client.get("/autocomplete?query=zzzzzz&stream=true")
+
+        assert response.status_code == 200
+        assert response.text == ""
+
+    def test_stream_validates_query(self, client):
+        """Test that stream mode still rejects whitespace-only queries"""
+
+        response = client.get("/autocomplete?query=   &stream=true")
+
+        assert response.status_code == 400
+
+
+class TestAdminStatsEndpoint:
+    def test_stats_returns_trie_statistics(self, client):
+        """Test that /admin/stats reports the trie and phrase index statistics"""
+
+        response = client.get("/admin/stats")
+
+        assert response.status_code == 200
+        data = response.json()
+        trie = data["trie"]
+        assert trie["word_count"] > 0
+        assert trie["node_count"] > trie["word_count"]
+        assert trie["memory_bytes"] > 0
+        assert sum(trie["branching_factors"].values()) == trie["node_count"]
+        assert sum(trie["depth_histogram"].values()) == trie["node_count"]
+        assert data["memory_bytes"] == trie["memory_bytes"] + data["phrases"]["memory_bytes"]
+
+
+class TestTracing:
+    def test_request_id_generated(self, client):
+        """Test that a request ID is assigned and returned"""
+
+        response = client.get("/autocomplete?query=app")
+
+        assert len(response.headers["X-Request-ID"]) == 32
+
+    def test_request_id_propagated(self, client):
+        """Test that a client-provided request ID is reused"""
+
+        response = client.get("/autocomplete?query=app", headers={"X-Request-ID": "trace-123"})
+
+        assert response.headers["X-Request-ID"] == "trace-123"
+
+    def test_access_log_is_json_with_stages(self, client):
+        """Test that the access log is a JSON line with search stage timings"""
+
+        with patch.object(access_logger, "info") as log:
+            client.get("/autocomplete?query=app", headers={"X-Request-ID": "trace-123"})
+
+        entry = json.loads(log.call_args[0][0])
+        assert entry["request_id"] == "trace-123"
+        assert entry["path"] == "/autocomplete"
+        assert entry["status"] == 200
+        assert entry["duration_ms"] >= 0
+        assert "trie" in entry["stages_ms"]
+        assert entry["profiled"] is False
+
+    def test_profiling_routes_disabled_by_default(self, client):
+        """Test that profiling routes are not registered unless enabled"""
+
+        assert client.get("/admin/profile").status_code == 404
+        assert client.post("/admin/profile?requests=1").status_code == 404
+
+    def test_on_demand_profiling(self, profiling_client):
+        """Test that armed searches are profiled and reported"""
+
+        assert profiling_client.post("/admin/profile?requests=1").json() == {"armed": 1}
+
+        with patch.object(access_logger, "info") as log:
+            profiling_client.get("/autocomplete?query=app")
+        assert json.loads(log.call_args[0][0])["profiled"] is True
+
+        data = profiling_client.get("/admin/profile").json()
+        assert data["profiled_requests"] == 1
+        assert "iter_search" in data["report"]
+
+        profiling_client.delete("/admin/profile")
+        assert profiling_client.get("/admin/profile").json()["profiled_requests"] == 0
+
+    def test_streamed_search_is_traced_and_profiled(self, profiling_client):
+        """Test that streamed searches report stages and can be profiled"""
+
+        profiling_client.delete("/admin/profile")
+        profiling_client.post("/admin/profile?requests=1")
+
+        with patch.object(access_logger, "info") as log:
+            profiling_client.get("/autocomplete?query=a&limit=500&stream=true")
+
+        entry = json.loads(log.call_args[0][0])
+        assert set(entry["stages_ms"]) == {"trie", "phrases"}
+        assert entry["profiled"] is True
+
+        data = profiling_client.get("/admin/profile").json()
+        assert data["profiled_requests"] == 1
+        assert "iter_search" in data["report"]
+        profiling_client.delete("/admin/profile")
+
 
 class TestHealthEndpoint:
     def test_health_returns_200_when_service_ready(self, client):
@@ -75,4 +250,53 @@ class TestHealthEndpoint:
             response = client.get("/health")
 
         assert response.status_code == 503
-        assert response.json() == {"status": "unhealthy"}
\ No newline at end of file
+        assert response.json() == {"status": "unhealthy"}
+
+    def test_autocomplete_returns_503_when_service_not_ready(self, client):
+        """Test that /autocomplete returns 503 while the service is loading"""
+        with patch.object(app.state, "service", None):
+            response = client.get("/autocomplete?query=app")
+
+        assert response.status_code == 503
+
+
+class TestFastStart:
+    def test_fast_start_loads_index_in_background(self, tmp_path, monkeypatch):
+        """Test that fast-start mode serves the prebuilt index once loaded"""
+
+        index_path = tmp_path / "trie.pickle"
+        TrieService(BASE_DIR).save_index(index_path)
+        monkeypatch.setenv(INDEX_PATH_ENV, str(index_path))
+        monkeypatch.setenv(FAST_START_ENV, "1")
+        # Restores the module client's service after the test
+        monkeypatch.setattr(app.state, "service", None)
+
+        with TestClient(app) as fast_client:
+            deadline = time.monotonic() + 5
+            while fast_client.get("/health").status_code != 200:
+                assert time.monotonic() < deadline
+                time.sleep(0.01)
+
+            response = fast_client.get("/autocomplete?query=app")
+
+        assert response.status_code == 200
+        assert len(response.json()) == 4
+
+    def test_fast_start_stays_unhealthy_on_failure(self, tmp_path, monkeypatch, caplog):
+        """Test that a failed background load is logged and keeps /health unhealthy"""
+
+        monkeypatch.setenv(INDEX_PATH_ENV, str(tmp_path / "missing.pickle"))
+        monkeypatch.setenv(FAST_START_ENV, "1")
+        # Restores the module client's service after the test
+        monkeypatch.setattr(app.state, "service", None)
+
+        with caplog.at_level(logging.ERROR, logger="app.api"):
+            with TestClient(app) as fast_client:
+                deadline = time.monotonic() + 5
+                while not any("Background service loading failed" in r.message for r in caplog.records):
+                    assert time.monotonic() < deadline
+                    time.sleep(0.01)
+
+                response = fast_client.get("/health")
+
+        assert response.status_code == 503
@@ -0,0 +1,59 @@
+import pickle
+
+import pytest
+
+from app.index import Index, load_index, save_index
+from app.phrase import PhraseIndex
+from app.trie import Trie
+
+class TestIndex:
+
+    def test_round_trip(self, tmp_path):
+        """Test that a saved index loads back with the same content and stats"""
+
+        trie = Trie()
+        phrases = PhraseIndex()
+        for word in ["cat", "catch", "category", "dog", "hot dog"]:
+            trie.insert(word)
+            phrases.insert(word)
+
+        index_path = tmp_path / "nested" / "trie.pickle"
+        save_index(Index(trie=trie, phrases=phrases), index_path)
+        loaded = load_index(index_path)
+
+        assert loaded.trie.search("cat") == ["cat", "catch", "category"]
+        assert loaded.trie.stats() == trie.stats()
+        assert list(loaded.phrases.iter_search("do")) == ["hot dog"]
+
+    def test_long_entry_round_trip(self, tmp_path):
+        """Test that entries longer than the recursion limit can be saved and loaded"""
+
+        long_entry = "a" * 5000
+        trie = Trie()
+        trie.insert(long_entry)
+        trie.insert("ab")
+        phrases = PhraseIndex()
+        phrases.insert("long " + long_entry)
+
+        index_path = tmp_path / "trie.pickle"
+        save_index(Index(trie=trie, phrases=phrases), index_path)
+        loaded = load_index(index_path)
+
+        assert loaded.trie.search("a") == ["a" * 5000, "ab"]
+        assert loaded.trie.stats() == trie.stats()
+        assert list(loaded.phrases.iter_search("aaa")) == ["long " + long_entry]
+
+    def test_missing_artifact(self, tmp_path):
+        """Test that a missing artifact raises FileNotFoundError"""
+
+        with pytest.raises(FileNotFoundError):
+            load_index(tmp_path / "missing.pickle")
+
+    def test_artifact_without_index(self, tmp_path):
+        """Test that an artifact not containing an index raises ValueError"""
+
+        index_path = tmp_path / "trie.pickle"
+        index_path.write_bytes(pickle.dumps(["not", "a", "trie"]))
+
+        with pytest.raises(ValueError):
+            load_index(index_path)
@@ -0,0 +1,25 @@
+import pytest
+
+from app.loader import load_dictionary
+
+class TestLoadDictionary:
+
+    def test_single_and_multi_word_entries(self, tmp_path):
+        """Test that multi-word entries are kept whole"""
+
+        dictionary = tmp_path / "dict.txt"
+        dictionary.write_text("1-1-1 aided\n1-1-2 darth   vader\n\nmalformed\n", encoding="utf-8")
+
+        result = load_dictionary(dictionary)
+
+        assert result.words == ["aided", "darth vader"]
+        assert result.skipped_count == 1
+
+    def test_no_valid_words(self, tmp_path):
+        """Test that a dictionary without valid entries raises ValueError"""
+
+        dictionary = tmp_path / "dict.txt"
+        dictionary.write_text("malformed\n", encoding="utf-8")
+
+        with pytest.raises(ValueError):
+            load_dictionary(dictionary)
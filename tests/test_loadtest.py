@@ -0,0 +1,74 @@
+import pytest
+
+from benchmarks.loadtest import LoadTestReport, load_query_log, synthesize_keystrokes
+
+class TestLoadTestReport:
+
+    def test_percentile_nearest_rank(self):
+        """Test that percentiles follow the nearest-rank method"""
+
+        report = LoadTestReport(latencies=[5.0, 1.0, 4.0, 2.0, 3.0])
+
+        assert report.percentile(50) == 3.0
+        assert report.percentile(0) == 1.0
+        assert report.percentile(100) == 5.0
+
+        report = LoadTestReport(latencies=[float(i) for i in range(1, 11)])
+        assert report.percentile(25) == 3.0
+        assert report.percentile(90) == 9.0
+        assert report.percentile(99) == 10.0
+
+    def test_percentile_without_samples(self):
+        """Test that an empty report has zero latency"""
+
+        assert LoadTestReport().percentile(50) == 0.0
+
+    def test_errors_split_by_class(self):
+        """Test that 4xx, 5xx and transport errors are counted separately"""
+
+        report = LoadTestReport(transport_errors=1)
+        report.status_codes.update({200: 6, 400: 1, 422: 1, 503: 1})
+
+        assert report.total == 10
+        assert report.client_errors == 2
+        assert report.server_errors == 1
+        assert report.errors == 4
+        assert report.summary()["error_rate"] == 0.4
+
+
+class TestWorkload:
+
+    def test_load_query_log(self, tmp_path):
+        """Test that blank lines are skipped and order is kept"""
+
+        log = tmp_path / "queries.txt"
+        log.write_text("fac\n\nfa\ndarth v\n", encoding="utf-8")
+
+        assert load_query_log(log) == ["fac", "fa", "darth v"]
+
+    def test_load_empty_query_log(self, tmp_path):
+        """Test that a log without queries raises ValueError"""
+
+        log = tmp_path / "queries.txt"
+        log.write_text("\n\n", encoding="utf-8")
+
+        with pytest.raises(ValueError):
+            load_query_log(log)
+
+    def test_synthesize_keystrokes(self):
+        """Test workload length, prefix order and reproducibility"""
+
+        words = ["apple", "banana", "cherry", "date"]
+
+        queries = synthesize_keystrokes(words, 100, seed=1)
+
+        assert len(queries) == 100
+        assert queries == synthesize_keystrokes(words, 100, seed=1)
+
+        # Every word is typed from its first character to the full word
+        assert queries[0] in {"a", "b", "c", "d"}
+        for previous, current in zip(queries, queries[1:]):
+            if len(current) > 1:
+                assert current[:-1] == previous
+            else:
+                assert previous in words
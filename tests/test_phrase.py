@@ -0,0 +1,125 @@
+import gc
+import tracemalloc
+
+from app.phrase import PhraseIndex
+from app.service import DICTIONARY_PATH, TrieService
+
+class TestPhraseIndex:
+
+    def _build(self, phrases):
+        index = PhraseIndex()
+        for phrase in phrases:
+            index.insert(phrase)
+        return index
+
+    def test_inner_token_prefix(self):
+        """Test that a prefix of an inner token matches the phrase"""
+
+        index = self._build(["darth vader", "millennium falcon", "vader"])
+
+        assert list(index.iter_search("vad")) == ["darth vader"]
+        assert list(index.iter_search("falc")) == ["millennium falcon"]
+
+    def test_leading_token_not_returned(self):
+        """Test that phrases starting with the query are left to the trie"""
+
+        index = self._build(["darth vader", "dark side of darth"])
+
+        assert list(index.iter_search("darth")) == ["dark side of darth"]
+        assert list(index.iter_search("dar")) == []
+
+    def test_multi_token_query(self):
+        """Test that a multi-token query matches across inner tokens"""
+
+        index = self._build(["anakin sky walker", "luke skywalker", "obi wan kenobi"])
+
+        assert list(index.iter_search("sky w")) == ["anakin sky walker"]
+        assert list(index.iter_search("wan ken")) == ["obi wan kenobi"]
+        assert list(index.iter_search("wan x")) == []
+
+    def test_results_sorted_and_unique(self):
+        """Test that results are alphabetical and deduplicated"""
+
+        index = self._build(["the star star", "a star", "dark star", "a star"])
+
+        assert list(index.iter_search("sta")) == ["a star", "dark star", "the star star"]
+
+    def test_case_insensitivity(self):
+        """Test that phrases and queries are lowercased"""
+
+        index = self._build(["Darth Vader"])
+
+        assert list(index.iter_search("VAD")) == ["darth vader"]
+
+    def test_single_words_not_indexed(self):
+        """Test that single-word entries add nothing to the index"""
+
+        index = self._build(["apple", "banana"])
+
+        assert list(index.iter_search("a")) == []
+
+    def test_empty_and_leading_space_query(self):
+        """Test that empty or space-prefixed queries match nothing"""
+
+        index = self._build(["darth vader"])
+
+        assert list(index.iter_search("")) == []
+        assert list(index.iter_search(" vader")) == []
+
+    def test_stats_counts(self):
+        """Test phrase, posting and token counts"""
+
+        index = self._build(["darth vader", "lord vader", "obi wan kenobi", "apple", "darth vader"])
+
+        stats = index.stats()
+        assert stats.phrase_count == 3
+        assert stats.posting_count == 4
+        assert stats.tokens.word_count == 3
+
+    def test_memory_matches_tracemalloc(self):
+        """Test that measured memory matches the allocations traced while building"""
+
+        phrases = [f"phrase {i} token{i % 50} tail{i % 7}" for i in range(2000)]
+
+        # Garbage from earlier tests must not be freed while measuring
+        gc.collect()
+        tracemalloc.start()
+        try:
+            before = tracemalloc.get_traced_memory()[0]
+            index = self._build(phrases)
+            traced = tracemalloc.get_traced_memory()[0] - before
+        finally:
+            tracemalloc.stop()
+
+        assert abs(index.stats().memory_bytes - traced) <= 0.05 * traced
+
+
+class TestServicePhraseSearch:
+
+    def test_leading_matches_ranked_first(self, tmp_path):
+        """Test that entries starting with the query come before inner token matches"""
+
+        dictionary = tmp_path / DICTIONARY_PATH
+        dictionary.parent.mkdir(parents=True)
+        dictionary.write_text(
+            "1 vader\n2 darth vader\n3 vaderland\n4 lord vader\n5 darth maul\n",
+            encoding="utf-8"
+        )
+
+        service = TrieService(tmp_path)
+
+        assert service.search("vad", limit=10) == ["vader", "vaderland", "darth vader", "lord vader"]
+        assert service.search("vad", limit=3) == ["vader", "vaderland", "darth vader"]
+        assert service.search("darth", limit=10) == ["darth maul", "darth vader"]
+
+    def test_stats_include_phrase_index(self, tmp_path):
+        """Test that service stats add the phrase index to the trie memory"""
+
+        dictionary = tmp_path / DICTIONARY_PATH
+        dictionary.parent.mkdir(parents=True)
+        dictionary.write_text("1 vader\n2 darth vader\n", encoding="utf-8")
+
+        stats = TrieService(tmp_path).stats()
+
+        assert stats.phrases.phrase_count == 1
+        assert stats.memory_bytes == stats.trie.memory_bytes + stats.phrases.memory_bytes
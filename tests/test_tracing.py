@@ -0,0 +1,103 @@
+from app.tracing import RequestTrace, SamplingProfiler, _current_trace, profiled, stage, timed
+
+class TestSamplingProfiler:
+
+    def test_disabled_never_samples(self):
+        """Test that a zero sampling rate never samples"""
+
+        profiler = SamplingProfiler()
+
+        assert not any(profiler.should_sample() for _ in range(100))
+
+    def test_samples_one_in_n(self):
+        """Test that one search out of N is sampled"""
+
+        profiler = SamplingProfiler(sample_every=4)
+
+        assert [profiler.should_sample() for _ in range(8)] == [False, False, False, True] * 2
+
+    def test_arm_samples_next_searches(self):
+        """Test that armed searches are sampled before falling back to the rate"""
+
+        profiler = SamplingProfiler()
+        profiler.arm(2)
+
+        assert [profiler.should_sample() for _ in range(3)] == [True, True, False]
+
+    def test_profile_aggregates_report(self):
+        """Test that profiled blocks are aggregated into the report"""
+
+        profiler = SamplingProfiler()
+        assert profiler.report(10) == ""
+
+        profiler.arm(2)
+        for _ in range(2):
+            assert profiler.should_sample()
+            with profiler.profile():
+                sorted(range(100))
+
+        assert profiler.profiled_requests == 2
+        assert "sorted" in profiler.report(10)
+
+        profiler.reset()
+        assert profiler.profiled_requests == 0
+        assert profiler.report(10) == ""
+
+
+class TestTraceContext:
+
+    def test_stage_outside_request_is_noop(self):
+        """Test that stages are ignored outside of a traced request"""
+
+        with stage("trie"):
+            pass
+
+    def test_stage_and_profiled_record_on_trace(self):
+        """Test that stages and profiling are recorded on the current trace"""
+
+        trace = RequestTrace(request_id="abc", profiler=SamplingProfiler(sample_every=1))
+        token = _current_trace.set(trace)
+        try:
+            with profiled():
+                with stage("trie"):
+                    pass
+                with stage("trie"):
+                    pass
+        finally:
+            _current_trace.reset(token)
+
+        assert list(trace.stages) == ["trie"]
+        assert trace.stages["trie"] >= 0
+        assert trace.profiled
+        assert trace.profiler.profiled_requests == 1
+
+    def test_profiled_decided_once_per_request(self):
+        """Test that repeated profiled blocks of one request share one sampling decision"""
+
+        profiler = SamplingProfiler(sample_every=2)
+        trace = RequestTrace(request_id="abc", profiler=profiler)
+        token = _current_trace.set(trace)
+        try:
+            for _ in range(3):
+                with profiled():
+                    pass
+        finally:
+            _current_trace.reset(token)
+
+        assert trace.profiled is False
+        assert profiler.profiled_requests == 0
+
+    def test_timed_iterator(self):
+        """Test that a lazy iterator is timed as a stage and yields the same items"""
+
+        assert list(timed("trie", iter([1, 2]))) == [1, 2]
+
+        trace = RequestTrace(request_id="abc", profiler=SamplingProfiler())
+        token = _current_trace.set(trace)
+        try:
+            items = timed("trie", iter([1, 2, 3]))
+        finally:
+            _current_trace.reset(token)
+
+        assert list(items) == [1, 2, 3]
+        assert trace.stages["trie"] >= 0
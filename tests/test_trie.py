@@ -1,3 +1,7 @@
+import gc
+import itertools
+import tracemalloc
+
 from app.trie import Trie
 
 class TestTrie:
@@ -404,3 +408,111 @@ class TestTrie:
 
         results = trie.search("100")
         assert "100%" in results
+
+    def test_iter_search_is_lazy(self):
+        """Test that iter_search yields words in order, one at a time"""
+
+        trie = Trie()
+        words = ["cat", "catch", "category", "cathedral", "cattle"]
+        for word in words:
+            trie.insert(word)
+
+        iterator = trie.iter_search("cat")
+        assert next(iterator) == "cat"
+        assert next(iterator) == "catch"
+        assert list(iterator) == ["category", "cathedral", "cattle"]
+
+    def test_iter_search_not_found(self):
+        """Test that iter_search yields nothing for empty or missing prefix"""
+
+        trie = Trie()
+        trie.insert("apple")
+
+        assert list(trie.iter_search("")) == []
+        assert list(trie.iter_search("xyz")) == []
+
+
+class TestTrieStats:
+
+    def test_empty_trie_stats(self):
+        """Test that an empty trie only counts the root node"""
+
+        stats = Trie().stats()
+
+        assert stats.node_count == 1
+        assert stats.word_count == 0
+        assert stats.branching_factors == {0: 1}
+        assert stats.depth_histogram == {0: 1}
+        assert stats.memory_bytes > 0
+
+    def test_stats_counts(self):
+        """Test node, word, branching and depth counts after inserts"""
+
+        trie = Trie()
+        for word in ["cat", "car", "cart", "dog", "cat"]:
+            trie.insert(word)
+
+        stats = trie.stats()
+
+        # root, c, ca, cat, car, cart, d, do, dog
+        assert stats.node_count == 9
+        assert stats.word_count == 4
+        assert stats.branching_factors == {0: 3, 1: 4, 2: 2}
+        assert stats.depth_histogram == {0: 1, 1: 2, 2: 2, 3: 3, 4: 1}
+
+    def test_stats_match_full_walk(self):
+        """Test that incremental stats match a full traversal of the trie"""
+
+        trie = Trie()
+        for word in ["apple", "application", "apply", "banana", "band", "bandana"]:
+            trie.insert(word)
+
+        node_count = 0
+        word_count = 0
+        branching = {}
+        stack = [trie.root]
+        while stack:
+            node = stack.pop()
+            node_count += 1
+            word_count += node.is_end_of_word
+            branching[len(node.children)] = branching.get(len(node.children), 0) + 1
+            stack.extend(node.children.values())
+
+        stats = trie.stats()
+        assert stats.node_count == node_count
+        assert stats.word_count == word_count
+        assert stats.branching_factors == dict(sorted(branching.items()))
+
+    def test_memory_grows_with_inserts(self):
+        """Test that measured memory grows as nodes are added"""
+
+        trie = Trie()
+        trie.insert("a")
+        before = trie.stats().memory_bytes
+
+        trie.insert("abcdef")
+        assert trie.stats().memory_bytes > before
+
+        # Duplicate insert adds no node
+        after = trie.stats().memory_bytes
+        trie.insert("abcdef")
+        assert trie.stats().memory_bytes == after
+
+    def test_memory_matches_tracemalloc(self):
+        """Test that measured memory matches the allocations traced while building"""
+
+        words = ["".join(chars) for chars in itertools.product("abcdefgh", repeat=4)]
+
+        # Garbage from earlier tests must not be freed while measuring
+        gc.collect()
+        tracemalloc.start()
+        try:
+            before = tracemalloc.get_traced_memory()[0]
+            trie = Trie()
+            for word in words:
+                trie.insert(word)
+            traced = tracemalloc.get_traced_memory()[0] - before
+        finally:
+            tracemalloc.stop()
+
+        assert abs(trie.stats().memory_bytes - traced) <= 0.05 * traced